@@ -14,4 +14,10 @@ DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///countdown.db')
 TIMEZONE = os.getenv('TIMEZONE', 'UTC')
 
 # Daily reminder time (24-hour format)
-DAILY_REMINDER_TIME = os.getenv('DAILY_REMINDER_TIME', '09:00') 
\ No newline at end of file
+DAILY_REMINDER_TIME = os.getenv('DAILY_REMINDER_TIME', '09:00') 
+
+# Per-user command rate limit: RATE_LIMIT commands per RATE_LIMIT_PERIOD seconds
+RATE_LIMIT = int(os.getenv('RATE_LIMIT', '5'))
+RATE_LIMIT_PERIOD = float(os.getenv('RATE_LIMIT_PERIOD', '60'))
+if RATE_LIMIT < 1 or RATE_LIMIT_PERIOD <= 0:
+    raise ValueError("RATE_LIMIT must be at least 1 and RATE_LIMIT_PERIOD must be positive")
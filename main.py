@@ -1,14 +1,17 @@
+import asyncio
+import functools
 import logging
+import time
 from datetime import datetime, timedelta
 import pytz
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Updater, CommandHandler, MessageHandler, Filters, CallbackQueryHandler
-from sqlalchemy.orm import Session
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from telegram.ext import Application, CommandHandler, CallbackQueryHandler
+from sqlalchemy import bindparam, lambda_stmt, select
+# Aliased so they don't clash with the handlers' `update` argument
+from sqlalchemy import delete as sql_delete, update as sql_update
 
-from config import TELEGRAM_BOT_TOKEN, TIMEZONE, DAILY_REMINDER_TIME
-from models import get_db, CountdownEvent
+from config import TELEGRAM_BOT_TOKEN, TIMEZONE, DAILY_REMINDER_TIME, RATE_LIMIT, RATE_LIMIT_PERIOD
+from models import AsyncSessionLocal, CountdownEvent, engine, init_db
 
 # Set up logging
 logging.basicConfig(
@@ -17,8 +20,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize scheduler
-scheduler = AsyncIOScheduler(timezone=TIMEZONE)
+# Daily reminder time, in the configured timezone
+REMINDER_HOUR, REMINDER_MINUTE = map(int, DAILY_REMINDER_TIME.split(':'))
+
+# Running reminder tasks, referenced so they aren't garbage collected mid-run
+_reminder_tasks = set()
+
+# Maximum number of reminder messages sent in parallel
+MAX_CONCURRENT_SENDS = 25
+
+# Per-user token buckets for rate limiting: user_id -> (tokens, last refill time)
+_buckets = {}
+_last_prune = time.monotonic()
 
 # Common timezones for quick selection
 COMMON_TIMEZONES = [
@@ -30,7 +43,53 @@ COMMON_TIMEZONES = [
     "Australia/Sydney"
 ]
 
-def start(update: Update, context):
+# Lookup of a chat's event by name; compiled once and reused from the statement cache
+_EVENT_BY_NAME = lambda_stmt(
+    lambda: select(CountdownEvent).where(
+        CountdownEvent.chat_id == bindparam("chat_id"),
+        CountdownEvent.name == bindparam("name")
+    )
+)
+
+_DEFAULT_TZ = pytz.timezone(TIMEZONE)
+
+@functools.lru_cache(maxsize=128)
+def _tz_keyboard(event_id):
+    """Return the (immutable) timezone selection keyboard for an event."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(tz, callback_data=f"tz|{event_id}|{i}")]
+        for i, tz in enumerate(COMMON_TIMEZONES)
+    ])
+
+def _allow(user_id, rate=RATE_LIMIT, per=RATE_LIMIT_PERIOD):
+    """Return whether a user may run another command, consuming a token if so."""
+    global _last_prune
+    now = time.monotonic()
+    if now - _last_prune >= per:
+        # Forget users whose bucket has refilled; they'd start from a full bucket anyway
+        for uid, (tokens, last) in list(_buckets.items()):
+            if tokens + (now - last) * rate / per >= rate:
+                del _buckets[uid]
+        _last_prune = now
+
+    tokens, last = _buckets.get(user_id, (rate, now))
+    tokens = min(rate, tokens + (now - last) * rate / per)
+    allowed = tokens >= 1
+    _buckets[user_id] = (tokens - 1 if allowed else tokens, now)
+    return allowed
+
+def _parse_ymd(date_str):
+    """Parse a YYYY-MM-DD string without going through strptime."""
+    if (
+        len(date_str) != 10
+        or date_str[4] != '-'
+        or date_str[7] != '-'
+        or not date_str.replace('-', '').isdigit()
+    ):
+        raise ValueError(f"Invalid date: {date_str}")
+    return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+
+async def start(update: Update, context):
     """Send a message when the command /start is issued."""
     welcome_message = (
         "👋 Welcome to the Countdown Bot!\n\n"
@@ -44,302 +103,367 @@ def start(update: Update, context):
         "6. Delete a countdown: /delete <name>\n"
         "7. Set timezone: /timezone <name>"
     )
-    update.message.reply_text(welcome_message)
+    await update.message.reply_text(welcome_message)
 
-def set_timezone(update: Update, context):
+async def set_timezone(update: Update, context):
     """Set timezone for a countdown event."""
+    if not _allow(update.effective_user.id):
+        return
+
     try:
-        db = next(get_db())
-        
-        if not context.args:
-            update.message.reply_text("Please provide a countdown name.\nExample: /timezone birthday")
-            return
-
-        name = context.args[0]
-        event = db.query(CountdownEvent).filter(CountdownEvent.name == name).first()
-
-        if not event:
-            update.message.reply_text(f"No countdown found with name '{name}'")
-            return
-
-        # Create inline keyboard with common timezones
-        keyboard = []
-        for tz in COMMON_TIMEZONES:
-            keyboard.append([InlineKeyboardButton(tz, callback_data=f"tz_{name}_{tz}")])
-        
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        update.message.reply_text(
-            f"Select timezone for '{name}':",
-            reply_markup=reply_markup
-        )
+        async with AsyncSessionLocal() as db:
+            if not context.args:
+                await update.message.reply_text("Please provide a countdown name.\nExample: /timezone birthday")
+                return
+
+            name = context.args[0]
+            result = await db.execute(
+                _EVENT_BY_NAME, {"chat_id": update.effective_chat.id, "name": name}
+            )
+            event = result.scalar_one_or_none()
+
+            if not event:
+                await update.message.reply_text(f"No countdown found with name '{name}'")
+                return
+
+            await update.message.reply_text(
+                f"Select timezone for '{name}':",
+                reply_markup=_tz_keyboard(event.id)
+            )
     except Exception as e:
         logger.error(f"Error setting timezone: {e}")
-        update.message.reply_text("An error occurred while setting the timezone.")
-    finally:
-        db.close()
+        await update.message.reply_text("An error occurred while setting the timezone.")
 
-def timezone_callback(update: Update, context):
+async def timezone_callback(update: Update, context):
     """Handle timezone selection callback."""
     query = update.callback_query
-    query.answer()
-    
+    await query.answer()
+    if not _allow(update.effective_user.id):
+        return
+
     try:
-        _, name, timezone = query.data.split('_')
-        db = next(get_db())
-        
-        event = db.query(CountdownEvent).filter(CountdownEvent.name == name).first()
-        if event:
-            event.timezone = timezone
-            db.commit()
-            query.edit_message_text(f"✅ Timezone for '{name}' set to {timezone}")
-        else:
-            query.edit_message_text(f"❌ Countdown '{name}' not found")
+        # Payload is "tz|<event id>|<index into COMMON_TIMEZONES>"
+        _, event_id, tz_index = query.data.split('|', 2)
+        timezone = COMMON_TIMEZONES[int(tz_index)]
+        async with AsyncSessionLocal() as db:
+            event_filter = (
+                CountdownEvent.chat_id == update.effective_chat.id,
+                CountdownEvent.id == int(event_id)
+            )
+            stmt = sql_update(CountdownEvent).where(*event_filter).values(timezone=timezone)
+            if engine.dialect.update_returning:
+                # RETURNING gives the name for the reply without a separate SELECT
+                result = await db.execute(
+                    stmt.returning(CountdownEvent.name),
+                    execution_options={"synchronize_session": False}
+                )
+                name = result.scalar_one_or_none()
+            else:
+                # MySQL/MariaDB and SQLite < 3.35 have no UPDATE ... RETURNING
+                name = await db.scalar(select(CountdownEvent.name).where(*event_filter))
+                if name is not None:
+                    await db.execute(stmt, execution_options={"synchronize_session": False})
+            await db.commit()
+            if name is not None:
+                await query.edit_message_text(f"✅ Timezone for '{name}' set to {timezone}")
+            else:
+                await query.edit_message_text("❌ Countdown not found")
     except Exception as e:
         logger.error(f"Error in timezone callback: {e}")
-        query.edit_message_text("An error occurred while setting the timezone.")
-    finally:
-        db.close()
+        await query.edit_message_text("An error occurred while setting the timezone.")
 
-def set_countdown(update: Update, context):
+async def set_countdown(update: Update, context):
     """Set a new countdown event."""
+    if not _allow(update.effective_user.id):
+        return
+
     try:
-        db = next(get_db())
-        
-        args = context.args
-        if len(args) < 2:
-            update.message.reply_text("Please provide a name and date.\nExample: /set birthday 2024-12-31")
-            return
-
-        name = args[0]
-        date_str = args[1]
-
-        try:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d")
-            # Use the default timezone from config
-            target_date = pytz.timezone(TIMEZONE).localize(target_date)
-        except ValueError:
-            update.message.reply_text("Invalid date format. Please use YYYY-MM-DD")
-            return
-
-        existing_event = db.query(CountdownEvent).filter(CountdownEvent.name == name).first()
-        if existing_event:
-            update.message.reply_text(f"A countdown with name '{name}' already exists.")
-            return
-
-        new_event = CountdownEvent(
-            name=name,
-            target_date=target_date,
-            chat_id=update.effective_chat.id,
-            created_by=update.effective_user.id,
-            created_at=datetime.now(pytz.timezone(TIMEZONE)),
-            timezone=TIMEZONE  # Set default timezone
-        )
+        async with AsyncSessionLocal() as db:
+            args = context.args
+            if len(args) < 2:
+                await update.message.reply_text("Please provide a name and date.\nExample: /set birthday 2024-12-31")
+                return
 
-        db.add(new_event)
-        db.commit()
+            name = args[0]
+            date_str = args[1]
 
-        update.message.reply_text(f"✅ Countdown '{name}' set for {target_date.strftime('%Y-%m-%d')}")
+            try:
+                target_date = _parse_ymd(date_str)
+                # Use the default timezone from config
+                target_date = _DEFAULT_TZ.localize(target_date)
+            except ValueError:
+                await update.message.reply_text("Invalid date format. Please use YYYY-MM-DD")
+                return
+
+            result = await db.execute(
+                _EVENT_BY_NAME, {"chat_id": update.effective_chat.id, "name": name}
+            )
+            existing_event = result.scalar_one_or_none()
+            if existing_event:
+                await update.message.reply_text(f"A countdown with name '{name}' already exists.")
+                return
+
+            new_event = CountdownEvent(
+                name=name,
+                # Stored as naive UTC (the columns have no timezone) so remaining time needs no per-event tz math
+                target_date=target_date.astimezone(pytz.UTC).replace(tzinfo=None),
+                chat_id=update.effective_chat.id,
+                created_by=update.effective_user.id,
+                created_at=datetime.now(pytz.UTC).replace(tzinfo=None),
+                timezone=TIMEZONE  # Set default timezone
+            )
+
+            db.add(new_event)
+            await db.commit()
+
+            await update.message.reply_text(f"✅ Countdown '{name}' set for {target_date.strftime('%Y-%m-%d')}")
     except Exception as e:
         logger.error(f"Error setting countdown: {e}")
-        update.message.reply_text("An error occurred while setting the countdown.")
-    finally:
-        db.close()
+        await update.message.reply_text("An error occurred while setting the countdown.")
 
-def get_countdown(update: Update, context):
+async def get_countdown(update: Update, context):
     """Get the remaining time for a countdown event."""
+    if not _allow(update.effective_user.id):
+        return
+
     try:
-        db = next(get_db())
-        
-        if not context.args:
-            update.message.reply_text("Please provide a countdown name.\nExample: /countdown birthday")
-            return
-
-        name = context.args[0]
-        event = db.query(CountdownEvent).filter(CountdownEvent.name == name).first()
-
-        if not event:
-            update.message.reply_text(f"No countdown found with name '{name}'")
-            return
-
-        # Convert target date to event's timezone
-        event_tz = pytz.timezone(event.timezone)
-        now = datetime.now(event_tz)
-        target_date = event.target_date.astimezone(event_tz)
-        remaining = target_date - now
-
-        if remaining.days < 0:
-            update.message.reply_text(f"❌ The event '{name}' has already passed!")
-            return
-
-        days = remaining.days
-        hours = remaining.seconds // 3600
-        minutes = (remaining.seconds % 3600) // 60
-
-        message = f"⏳ Countdown for '{name}':\n"
-        message += f"Timezone: {event.timezone}\n"
-        message += f"Remaining: {days} days, {hours} hours, {minutes} minutes"
-        
-        update.message.reply_text(message)
+        async with AsyncSessionLocal() as db:
+            if not context.args:
+                await update.message.reply_text("Please provide a countdown name.\nExample: /countdown birthday")
+                return
+
+            name = context.args[0]
+            result = await db.execute(
+                _EVENT_BY_NAME, {"chat_id": update.effective_chat.id, "name": name}
+            )
+            event = result.scalar_one_or_none()
+
+            if not event:
+                await update.message.reply_text(f"No countdown found with name '{name}'")
+                return
+
+            # Both instants are UTC; the event timezone is only shown to the user
+            remaining = event.target_date.replace(tzinfo=pytz.UTC) - datetime.now(pytz.UTC)
+
+            if remaining.days < 0:
+                await update.message.reply_text(f"❌ The event '{name}' has already passed!")
+                return
+
+            days = remaining.days
+            hours = remaining.seconds // 3600
+            minutes = (remaining.seconds % 3600) // 60
+
+            message = f"⏳ Countdown for '{name}':\n"
+            message += f"Timezone: {event.timezone}\n"
+            message += f"Remaining: {days} days, {hours} hours, {minutes} minutes"
+
+            await update.message.reply_text(message)
     except Exception as e:
         logger.error(f"Error getting countdown: {e}")
-        update.message.reply_text("An error occurred while getting the countdown.")
-    finally:
-        db.close()
+        await update.message.reply_text("An error occurred while getting the countdown.")
 
-def list_countdowns(update: Update, context):
+async def list_countdowns(update: Update, context):
     """List all countdown events."""
+    if not _allow(update.effective_user.id):
+        return
+
     try:
-        db = next(get_db())
-        
-        events = db.query(CountdownEvent).filter(
-            CountdownEvent.chat_id == update.effective_chat.id
-        ).all()
-
-        if not events:
-            update.message.reply_text("No countdown events found.")
-            return
-
-        message = "📋 Your countdown events:\n\n"
-        for event in events:
-            event_tz = pytz.timezone(event.timezone)
-            now = datetime.now(event_tz)
-            target_date = event.target_date.astimezone(event_tz)
-            remaining = target_date - now
-            days = remaining.days if remaining.days >= 0 else 0
-            
-            reminder_status = "🔔" if event.daily_reminder else "🔕"
-            message += f"{reminder_status} {event.name} ({event.timezone}): {days} days remaining\n"
-
-        update.message.reply_text(message)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(
+                CountdownEvent.name,
+                CountdownEvent.target_date,
+                CountdownEvent.timezone,
+                CountdownEvent.daily_reminder
+            ).where(
+                CountdownEvent.chat_id == update.effective_chat.id
+            ))
+            rows = result.all()
+
+            if not rows:
+                await update.message.reply_text("No countdown events found.")
+                return
+
+            lines = ["📋 Your countdown events:", ""]
+            now_utc = datetime.now(pytz.UTC)
+            for name, target_date, tz_name, reminder in rows:
+                remaining = target_date.replace(tzinfo=pytz.UTC) - now_utc
+                days = remaining.days if remaining.days >= 0 else 0
+
+                reminder_status = "🔔" if reminder else "🔕"
+                lines.append(f"{reminder_status} {name} ({tz_name}): {days} days remaining")
+
+            await update.message.reply_text("\n".join(lines))
     except Exception as e:
         logger.error(f"Error listing countdowns: {e}")
-        update.message.reply_text("An error occurred while listing countdowns.")
-    finally:
-        db.close()
+        await update.message.reply_text("An error occurred while listing countdowns.")
 
-def toggle_reminder(update: Update, context, enable: bool):
+async def toggle_reminder(update: Update, context, enable: bool):
     """Enable or disable daily reminders for a countdown event."""
-    try:
-        db = next(get_db())
-        
-        if not context.args:
-            update.message.reply_text("Please provide a countdown name.")
-            return
+    if not _allow(update.effective_user.id):
+        return
 
-        name = context.args[0]
-        event = db.query(CountdownEvent).filter(CountdownEvent.name == name).first()
-
-        if not event:
-            update.message.reply_text(f"No countdown found with name '{name}'")
-            return
-
-        event.daily_reminder = enable
-        db.commit()
-
-        status = "enabled" if enable else "disabled"
-        update.message.reply_text(f"✅ Daily reminders for '{name}' have been {status}.")
+    try:
+        async with AsyncSessionLocal() as db:
+            if not context.args:
+                await update.message.reply_text("Please provide a countdown name.")
+                return
+
+            name = context.args[0]
+            result = await db.execute(
+                sql_update(CountdownEvent).where(
+                    CountdownEvent.chat_id == update.effective_chat.id,
+                    CountdownEvent.name == name
+                ).values(daily_reminder=enable),
+                execution_options={"synchronize_session": False}
+            )
+            await db.commit()
+
+            if result.rowcount == 0:
+                await update.message.reply_text(f"No countdown found with name '{name}'")
+                return
+
+            status = "enabled" if enable else "disabled"
+            await update.message.reply_text(f"✅ Daily reminders for '{name}' have been {status}.")
     except Exception as e:
         logger.error(f"Error toggling reminder: {e}")
-        update.message.reply_text("An error occurred while toggling the reminder.")
-    finally:
-        db.close()
+        await update.message.reply_text("An error occurred while toggling the reminder.")
 
-def delete_countdown(update: Update, context):
+async def delete_countdown(update: Update, context):
     """Delete a countdown event."""
-    try:
-        db = next(get_db())
-        
-        if not context.args:
-            update.message.reply_text("Please provide a countdown name.")
-            return
-
-        name = context.args[0]
-        event = db.query(CountdownEvent).filter(CountdownEvent.name == name).first()
-
-        if not event:
-            update.message.reply_text(f"No countdown found with name '{name}'")
-            return
+    if not _allow(update.effective_user.id):
+        return
 
-        db.delete(event)
-        db.commit()
-
-        update.message.reply_text(f"✅ Countdown '{name}' has been deleted.")
+    try:
+        async with AsyncSessionLocal() as db:
+            if not context.args:
+                await update.message.reply_text("Please provide a countdown name.")
+                return
+
+            name = context.args[0]
+            result = await db.execute(
+                sql_delete(CountdownEvent).where(
+                    CountdownEvent.chat_id == update.effective_chat.id,
+                    CountdownEvent.name == name
+                ),
+                execution_options={"synchronize_session": False}
+            )
+            await db.commit()
+
+            if result.rowcount == 0:
+                await update.message.reply_text(f"No countdown found with name '{name}'")
+                return
+
+            await update.message.reply_text(f"✅ Countdown '{name}' has been deleted.")
     except Exception as e:
         logger.error(f"Error deleting countdown: {e}")
-        update.message.reply_text("An error occurred while deleting the countdown.")
-    finally:
-        db.close()
+        await update.message.reply_text("An error occurred while deleting the countdown.")
 
-def send_daily_reminders(context):
+async def send_daily_reminders(bot):
     """Send daily reminders for all events with reminders enabled."""
     try:
-        db = next(get_db())
-        
-        events = db.query(CountdownEvent).filter(CountdownEvent.daily_reminder == True).all()
-        
-        for event in events:
-            event_tz = pytz.timezone(event.timezone)
-            now = datetime.now(event_tz)
-            target_date = event.target_date.astimezone(event_tz)
-            remaining = target_date - now
-            
-            if remaining.days < 0:
-                continue
-                
-            days = remaining.days
-            hours = remaining.seconds // 3600
-            minutes = (remaining.seconds % 3600) // 60
-            
-            message = f"⏰ Daily Reminder for '{event.name}':\n"
-            message += f"Timezone: {event.timezone}\n"
-            message += f"Remaining: {days} days, {hours} hours, {minutes} minutes"
-            
-            try:
-                context.bot.send_message(
-                    chat_id=event.chat_id,
-                    text=message
-                )
-            except Exception as e:
-                logger.error(f"Error sending reminder for {event.name}: {e}")
-                
+        async with AsyncSessionLocal() as db:
+            now_utc = datetime.now(pytz.UTC)
+            # Target dates are stored as naive UTC, so let the database skip expired events
+            result = await db.execute(select(
+                CountdownEvent.chat_id,
+                CountdownEvent.name,
+                CountdownEvent.target_date,
+                CountdownEvent.timezone
+            ).where(
+                CountdownEvent.daily_reminder == True,
+                CountdownEvent.target_date >= now_utc.replace(tzinfo=None)
+            ))
+            rows = result.all()
+
+            prepared = []
+            for chat_id, name, target_date, tz_name in rows:
+                remaining = target_date.replace(tzinfo=pytz.UTC) - now_utc
+
+                days = remaining.days
+                hours = remaining.seconds // 3600
+                minutes = (remaining.seconds % 3600) // 60
+
+                message = f"⏰ Daily Reminder for '{name}':\n"
+                message += f"Timezone: {tz_name}\n"
+                message += f"Remaining: {days} days, {hours} hours, {minutes} minutes"
+                prepared.append((chat_id, name, message))
+
+        # Send outside the DB session; the semaphore keeps us under Telegram's rate limits
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+        async def send(chat_id, message):
+            async with semaphore:
+                await bot.send_message(chat_id=chat_id, text=message)
+
+        results = await asyncio.gather(
+            *(send(chat_id, message) for chat_id, _, message in prepared),
+            return_exceptions=True
+        )
+        for (_, name, _), result in zip(prepared, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending reminder for {name}: {result}")
+
     except Exception as e:
         logger.error(f"Error in daily reminders: {e}")
+
+def _next_daily(hour, minute, tz, after):
+    """Return the first hour:minute local time in tz strictly after the given instant."""
+    day = after.astimezone(tz).date()
+    while True:
+        fire = tz.localize(datetime(day.year, day.month, day.day, hour, minute))
+        if fire > after:
+            return fire
+        day += timedelta(days=1)
+
+def schedule_daily_reminders(bot, after=None):
+    """Arm the next daily reminder run on the running event loop."""
+    now = datetime.now(pytz.UTC)
+    fire = _next_daily(REMINDER_HOUR, REMINDER_MINUTE, _DEFAULT_TZ, after or now)
+    asyncio.get_running_loop().call_later((fire - now).total_seconds(), _start_daily_reminders, bot, fire)
+
+def _start_daily_reminders(bot, fire):
+    """Start the reminder run as a task and keep a reference to it until it finishes."""
+    task = asyncio.create_task(_run_daily_reminders(bot, fire))
+    _reminder_tasks.add(task)
+    task.add_done_callback(_reminder_tasks.discard)
+
+async def _run_daily_reminders(bot, fire):
+    """Send the reminders due at fire, then re-arm for the next day."""
+    try:
+        await send_daily_reminders(bot)
     finally:
-        db.close()
+        # Re-arm relative to this run's slot so an early wake-up can't fire it twice
+        schedule_daily_reminders(bot, after=fire)
 
 def main():
     """Start the bot."""
-    # Create the Updater and pass it your bot's token
-    updater = Updater(TELEGRAM_BOT_TOKEN, use_context=True)
+    async def post_init(application: Application):
+        """Create the tables and arm the daily reminders on the bot's event loop."""
+        await init_db()
+        schedule_daily_reminders(application.bot)
 
-    # Get the dispatcher to register handlers
-    dispatcher = updater.dispatcher
+    async def post_shutdown(application: Application):
+        """Close the pooled database connections."""
+        await engine.dispose()
+
+    # Create the Application and pass it your bot's token
+    application = Application.builder().token(TELEGRAM_BOT_TOKEN).post_init(post_init).post_shutdown(post_shutdown).build()
 
     # Add command handlers
-    dispatcher.add_handler(CommandHandler("start", start))
-    dispatcher.add_handler(CommandHandler("set", set_countdown))
-    dispatcher.add_handler(CommandHandler("countdown", get_countdown))
-    dispatcher.add_handler(CommandHandler("list", list_countdowns))
-    dispatcher.add_handler(CommandHandler("remind", lambda update, context: toggle_reminder(update, context, True)))
-    dispatcher.add_handler(CommandHandler("unremind", lambda update, context: toggle_reminder(update, context, False)))
-    dispatcher.add_handler(CommandHandler("delete", delete_countdown))
-    dispatcher.add_handler(CommandHandler("timezone", set_timezone))
-    
+    application.add_handler(CommandHandler("start", start))
+    application.add_handler(CommandHandler("set", set_countdown))
+    application.add_handler(CommandHandler("countdown", get_countdown))
+    application.add_handler(CommandHandler("list", list_countdowns))
+    application.add_handler(CommandHandler("remind", lambda update, context: toggle_reminder(update, context, True)))
+    application.add_handler(CommandHandler("unremind", lambda update, context: toggle_reminder(update, context, False)))
+    application.add_handler(CommandHandler("delete", delete_countdown))
+    application.add_handler(CommandHandler("timezone", set_timezone))
+
     # Add callback handler for timezone selection
-    dispatcher.add_handler(CallbackQueryHandler(timezone_callback, pattern="^tz_"))
-
-    # Set up daily reminders
-    hour, minute = map(int, DAILY_REMINDER_TIME.split(':'))
-    scheduler.add_job(
-        send_daily_reminders,
-        trigger=CronTrigger(hour=hour, minute=minute),
-        id='daily_reminders'
-    )
-    scheduler.start()
+    application.add_handler(CallbackQueryHandler(timezone_callback, pattern=r"^tz\|"))
 
     # Start the Bot
-    updater.start_polling()
-    updater.idle()
+    application.run_polling()
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
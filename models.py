@@ -1,21 +1,48 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, inspect, Column, Integer, BigInteger, String, DateTime, Boolean, Index
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 from config import DATABASE_URL
 
+# Plain SQLite URLs are run on the aiosqlite driver; other databases need an async driver in the URL
+database_url = make_url(DATABASE_URL)
+IS_SQLITE = database_url.get_backend_name() == "sqlite"
+if IS_SQLITE and not database_url.get_dialect().is_async:
+    database_url = database_url.set(drivername="sqlite+aiosqlite")
+
 # Create database engine
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine_options = {"echo": False, "pool_pre_ping": True, "pool_recycle": 1800}
+if IS_SQLITE and database_url.database in (None, "", ":memory:"):
+    # An in-memory database only lives as long as its connection, so share a single one
+    engine_options.update(poolclass=StaticPool)
+else:
+    # aiosqlite would default to NullPool (a new connection and thread per session), so pool explicitly
+    engine_options.update(poolclass=AsyncAdaptedQueuePool, pool_size=10, max_overflow=20)
+engine = create_async_engine(database_url, **engine_options)
+
+if IS_SQLITE:
+    # synchronous and temp_store are per-connection settings, applied once per pooled connection
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 class CountdownEvent(Base):
     __tablename__ = "countdown_events"
+    # Event names are unique per chat, not globally
+    __table_args__ = (Index('ix_chat_name', 'chat_id', 'name', unique=True),)
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, index=True)
+    name = Column(String, index=True)
     target_date = Column(DateTime)
-    chat_id = Column(Integer)  # Telegram chat ID where the event was created
-    created_by = Column(Integer)  # Telegram user ID who created the event
+    chat_id = Column(BigInteger, index=True)  # Telegram chat ID where the event was created
+    created_by = Column(BigInteger)  # Telegram user ID who created the event
     daily_reminder = Column(Boolean, default=False)
     created_at = Column(DateTime)
     timezone = Column(String, default="Europe/Berlin")  # Default timezone for the event
@@ -23,13 +50,39 @@ class CountdownEvent(Base):
     def __repr__(self):
         return f"<CountdownEvent(name='{self.name}', target_date='{self.target_date}')>"
 
+def _migrate_indexes(connection):
+    """Bring indexes of tables created before names became per-chat up to date."""
+    existing = {index["name"]: index for index in inspect(connection).get_indexes(CountdownEvent.__tablename__)}
+    for index in CountdownEvent.__table__.indexes:
+        current = existing.get(index.name)
+        if current is not None and bool(current["unique"]) == index.unique:
+            continue
+        if current is not None:
+            # Older tables made names globally unique; recreate the index as non-unique
+            index.drop(connection)
+        index.create(connection)
+
+def _migrate_id_columns(connection):
+    """Widen Telegram id columns of tables created when they were INTEGER."""
+    if connection.dialect.name == "sqlite":
+        # SQLite stores integers as 64-bit regardless of the declared type
+        return
+    quote = connection.dialect.identifier_preparer.quote
+    table = quote(CountdownEvent.__tablename__)
+    for column in inspect(connection).get_columns(CountdownEvent.__tablename__):
+        if column["name"] not in ("chat_id", "created_by") or isinstance(column["type"], BigInteger):
+            continue
+        if connection.dialect.name == "mysql":
+            connection.exec_driver_sql(f"ALTER TABLE {table} MODIFY {quote(column['name'])} BIGINT")
+        else:
+            connection.exec_driver_sql(f"ALTER TABLE {table} ALTER COLUMN {quote(column['name'])} TYPE BIGINT")
+
 # Create all tables
-Base.metadata.create_all(bind=engine)
-
-# Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close() 
\ No newline at end of file
+async def init_db():
+    async with engine.begin() as conn:
+        if IS_SQLITE:
+            # WAL with synchronous=NORMAL avoids an fsync per commit; the journal mode persists in the file
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_migrate_indexes)
+        await conn.run_sync(_migrate_id_columns)